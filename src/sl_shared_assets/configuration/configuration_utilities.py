@@ -4,6 +4,7 @@ This module contains the acquisition systems enumeration, server configuration,
 management functions, and experiment configuration factory.
 """
 
+import os
 from copy import deepcopy
 from enum import StrEnum
 from pathlib import Path
@@ -58,6 +59,15 @@ ExperimentConfigFactory = Callable[
 _EXPERIMENT_CONFIG_FACTORIES: dict[str, ExperimentConfigFactory] = {}
 """Maps acquisition system names to their experiment configuration factory functions."""
 
+_PATH_FILE_CACHE: dict[str, tuple[tuple[int, int, int], Path]] = {}
+"""Maps the paths to the previously read path cache .txt files to the (inode, modification time, size) stamp of each
+file and the path stored inside it. Used to avoid re-reading unchanged path cache files. Since the path cache files are
+always replaced atomically, each update also changes the file's inode."""
+
+_SYSTEM_CONFIGURATION_CACHE: dict[str, tuple[tuple[int, int], SystemConfiguration]] = {}
+"""Maps the paths to the previously loaded system configuration files to the (modification time, size) stamp of each
+file and the configuration data loaded from it. Used to avoid re-parsing unchanged configuration files."""
+
 
 def _create_mesoscope_experiment_config(
     template: TaskTemplate,
@@ -125,6 +135,88 @@ class ServerConfiguration(YamlConfig):
         self.user_working_root = str(Path(self.working_root).joinpath(f"{self.username}"))
 
 
+def _get_app_directory() -> Path:
+    """Resolves the path to the user data directory used to cache the paths to the local Sun lab's assets.
+
+    Notes:
+        The directory is resolved on every call, as it depends on the runtime environment of the calling process.
+
+    Returns:
+        The path to the user data directory.
+    """
+    return Path(appdirs.user_data_dir(appname="sun_lab_data", appauthor="sun_lab"))
+
+
+def _read_path_file(path_file: Path) -> Path | None:
+    """Reads the path stored in the target path cache .txt file.
+
+    Notes:
+        If the file was not modified since it was last read by this process, returns the previously read path without
+        re-reading the file.
+
+    Args:
+        path_file: The path to the .txt file used to cache the path.
+
+    Returns:
+        The path stored in the file or None, if the file does not exist.
+    """
+    try:
+        stat = path_file.stat()
+    except FileNotFoundError:
+        return None
+
+    stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    cache_key = str(path_file)
+    cached = _PATH_FILE_CACHE.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    with path_file.open() as f:
+        path = Path(f.read().strip())
+    _PATH_FILE_CACHE[cache_key] = (stamp, path)
+    return path
+
+
+def _write_path_file(path_file: Path, path: Path) -> None:
+    """Atomically replaces the contents of the target path cache .txt file with the input path.
+
+    Notes:
+        The data is first written to a temporary file, which then replaces the target file. This ensures that
+        concurrent readers always see either the previous or the new path, but never a partially written file.
+
+    Args:
+        path_file: The path to the .txt file used to cache the path.
+        path: The path to write to the cache file.
+    """
+    temporary_file = path_file.with_name(f"{path_file.name}.{os.getpid()}.tmp")
+    with temporary_file.open("w") as f:
+        f.write(str(path))
+        f.flush()
+        os.fsync(f.fileno())
+    temporary_file.replace(path_file)
+
+
+def _find_system_configuration_files(directory: Path) -> tuple[Path, ...]:
+    """Finds all data acquisition system configuration files stored in the target directory.
+
+    Notes:
+        Uses a single directory scan with plain file name comparisons instead of glob pattern matching. Matches the
+        same entries as the '*_system_configuration.yaml' glob pattern.
+
+    Args:
+        directory: The path to the directory to search for the system configuration files.
+
+    Returns:
+        A tuple of paths to all discovered system configuration files. The tuple is empty if the directory does not
+        exist.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return tuple(Path(entry.path) for entry in entries if entry.name.endswith("_system_configuration.yaml"))
+    except FileNotFoundError:
+        return ()
+
+
 def set_working_directory(path: Path) -> None:
     """Sets the specified directory as the Sun lab's working directory for the local machine (PC).
 
@@ -137,7 +229,7 @@ def set_working_directory(path: Path) -> None:
         path: The path to the directory to set as the local Sun lab's working directory.
     """
     # Resolves the path to the static .txt file used to store the path to the system configuration file
-    app_dir = Path(appdirs.user_data_dir(appname="sun_lab_data", appauthor="sun_lab"))
+    app_dir = _get_app_directory()
     path_file = app_dir.joinpath("working_directory_path.txt")
 
     # In case this function is called before the app directory is created, ensures the app directory exists
@@ -150,8 +242,7 @@ def set_working_directory(path: Path) -> None:
     ensure_directory_exists(path.joinpath("configuration"))
 
     # Replaces the contents of the working_directory_path.txt file with the provided path
-    with path_file.open("w") as f:
-        f.write(str(path))
+    _write_path_file(path_file=path_file, path=path)
 
     console.echo(message=f"Sun lab's working directory set to: {path}.", level=LogLevel.SUCCESS)
 
@@ -166,20 +257,20 @@ def get_working_directory() -> Path:
         FileNotFoundError: If the local working directory has not been configured for the host-machine.
     """
     # Uses appdirs to locate the user data directory and resolve the path to the configuration file
-    app_dir = Path(appdirs.user_data_dir(appname="sun_lab_data", appauthor="sun_lab"))
+    app_dir = _get_app_directory()
     path_file = app_dir.joinpath("working_directory_path.txt")
 
+    # Loads the path to the local working directory
+    working_directory = _read_path_file(path_file=path_file)
+
     # If the cache file or the Sun lab's data directory does not exist, aborts with an error
-    if not path_file.exists():
+    if working_directory is None:
         message = (
             "Unable to resolve the path to the local Sun lab's working directory, as it has not been set. "
             "Set the local working directory by using the 'sl-configure directory' CLI command."
         )
         console.error(message=message, error=FileNotFoundError)
-
-    # Loads the path to the local working directory
-    with path_file.open() as f:
-        working_directory = Path(f.read().strip())
+        raise FileNotFoundError(message)  # pragma: no cover
 
     # If the configuration file does not exist, also aborts with an error
     if not working_directory.exists():
@@ -224,15 +315,14 @@ def set_google_credentials_path(path: Path) -> None:
         console.error(message=message, error=ValueError)
 
     # Resolves the path to the static .txt file used to store the path to the Google Sheets credentials file
-    app_dir = Path(appdirs.user_data_dir(appname="sun_lab_data", appauthor="sun_lab"))
+    app_dir = _get_app_directory()
     path_file = app_dir.joinpath("google_credentials_path.txt")
 
     # In case this function is called before the app directory is created, ensures the app directory exists
     ensure_directory_exists(path_file)
 
     # Writes the absolute path to the credentials file
-    with path_file.open("w") as f:
-        f.write(str(path.resolve()))
+    _write_path_file(path_file=path_file, path=path.resolve())
 
 
 def get_google_credentials_path() -> Path:
@@ -246,20 +336,20 @@ def get_google_credentials_path() -> Path:
             or if the previously configured credentials file no longer exists at the expected path.
     """
     # Uses appdirs to locate the user data directory and resolve the path to the credentials' path cache file
-    app_dir = Path(appdirs.user_data_dir(appname="sun_lab_data", appauthor="sun_lab"))
+    app_dir = _get_app_directory()
     path_file = app_dir.joinpath("google_credentials_path.txt")
 
+    # Once the location of the path storage file is resolved, reads the file path from the file
+    credentials_path = _read_path_file(path_file=path_file)
+
     # If the cache file does not exist, aborts with an error
-    if not path_file.exists():
+    if credentials_path is None:
         message = (
             "Unable to resolve the path to the Google account credentials file, as it has not been set. "
             "Set the Google service account credentials path by using the 'sl-configure google' CLI command."
         )
         console.error(message=message, error=FileNotFoundError)
-
-    # Once the location of the path storage file is resolved, reads the file path from the file
-    with path_file.open() as f:
-        credentials_path = Path(f.read().strip())
+        raise FileNotFoundError(message)  # pragma: no cover
 
     # If the credentials' file does not exist at the cached path, aborts with an error
     if not credentials_path.exists():
@@ -304,15 +394,14 @@ def set_task_templates_directory(path: Path) -> None:
         console.error(message=message, error=ValueError)
 
     # Resolves the path to the static .txt file used to store the path to the task templates directory
-    app_dir = Path(appdirs.user_data_dir(appname="sun_lab_data", appauthor="sun_lab"))
+    app_dir = _get_app_directory()
     path_file = app_dir.joinpath("task_templates_directory_path.txt")
 
     # In case this function is called before the app directory is created, ensures the app directory exists
     ensure_directory_exists(path_file)
 
     # Writes the absolute path to the task templates directory
-    with path_file.open("w") as f:
-        f.write(str(path.resolve()))
+    _write_path_file(path_file=path_file, path=path.resolve())
 
     console.echo(message=f"Task templates directory path set to: {path.resolve()}.", level=LogLevel.SUCCESS)
 
@@ -328,20 +417,20 @@ def get_task_templates_directory() -> Path:
             the previously configured directory no longer exists at the expected path.
     """
     # Uses appdirs to locate the user data directory and resolve the path to the task templates directory cache file
-    app_dir = Path(appdirs.user_data_dir(appname="sun_lab_data", appauthor="sun_lab"))
+    app_dir = _get_app_directory()
     path_file = app_dir.joinpath("task_templates_directory_path.txt")
 
+    # Once the location of the path storage file is resolved, reads the directory path from the file
+    templates_directory = _read_path_file(path_file=path_file)
+
     # If the cache file does not exist, aborts with an error
-    if not path_file.exists():
+    if templates_directory is None:
         message = (
             "Unable to resolve the path to the task templates directory, as it has not been set. "
             "Set the task templates directory path by using the 'sl-configure templates' CLI command."
         )
         console.error(message=message, error=FileNotFoundError)
-
-    # Once the location of the path storage file is resolved, reads the directory path from the file
-    with path_file.open() as f:
-        templates_directory = Path(f.read().strip())
+        raise FileNotFoundError(message)  # pragma: no cover
 
     # If the templates directory does not exist at the cached path, aborts with an error
     if not templates_directory.exists():
@@ -383,7 +472,7 @@ def create_system_configuration_file(system: AcquisitionSystems | str) -> None:
     directory = directory.joinpath("configuration")
 
     # Removes any existing system configuration files to ensure only one system configuration exists on each machine.
-    existing_configs = tuple(directory.glob("*_system_configuration.yaml"))
+    existing_configs = _find_system_configuration_files(directory=directory)
     for config_file in existing_configs:
         console.echo(f"Removing the existing configuration file {config_file.name}...")
         config_file.unlink()
@@ -415,7 +504,7 @@ def get_system_configuration_data() -> SystemConfiguration:
     directory = get_working_directory()
     directory = directory.joinpath("configuration")
 
-    config_files = tuple(directory.glob("*_system_configuration.yaml"))
+    config_files = _find_system_configuration_files(directory=directory)
 
     if len(config_files) != 1:
         file_names = [f.name for f in config_files]
@@ -440,8 +529,19 @@ def get_system_configuration_data() -> SystemConfiguration:
         console.error(message=message, error=ValueError)
         raise ValueError(message)  # pragma: no cover
 
+    # Reuses the previously loaded configuration data if the file has not been modified since it was last parsed. Since
+    # callers may modify the returned instance, each call returns an independent copy of the cached data.
+    stat = configuration_file.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cache_key = str(configuration_file)
+    cached = _SYSTEM_CONFIGURATION_CACHE.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        return deepcopy(cached[1])
+
     configuration_class = _CONFIG_FILE_TO_CLASS[file_name]
-    return configuration_class.from_yaml(file_path=configuration_file)
+    configuration = configuration_class.from_yaml(file_path=configuration_file)
+    _SYSTEM_CONFIGURATION_CACHE[cache_key] = (stamp, deepcopy(configuration))
+    return configuration
 
 
 def create_server_configuration_file(
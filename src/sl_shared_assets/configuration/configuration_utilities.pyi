@@ -30,6 +30,8 @@ ExperimentConfigFactory = Callable[
     [TaskTemplate, str, dict[str, WaterRewardTrial | GasPuffTrial], float], ExperimentConfiguration
 ]
 _EXPERIMENT_CONFIG_FACTORIES: dict[str, ExperimentConfigFactory]
+_PATH_FILE_CACHE: dict[str, tuple[tuple[int, int, int], Path]]
+_SYSTEM_CONFIGURATION_CACHE: dict[str, tuple[tuple[int, int], SystemConfiguration]]
 
 def _create_mesoscope_experiment_config(
     template: TaskTemplate,
@@ -51,6 +53,10 @@ class ServerConfiguration(YamlConfig):
     user_working_root: str = field(init=False, default_factory=Incomplete)
     def __post_init__(self) -> None: ...
 
+def _get_app_directory() -> Path: ...
+def _read_path_file(path_file: Path) -> Path | None: ...
+def _write_path_file(path_file: Path, path: Path) -> None: ...
+def _find_system_configuration_files(directory: Path) -> tuple[Path, ...]: ...
 def set_working_directory(path: Path) -> None: ...
 def get_working_directory() -> Path: ...
 def set_google_credentials_path(path: Path) -> None: ...
@@ -2,7 +2,7 @@ from dataclasses import field, dataclass
 
 from .vr_configuration import TrialStructure as TrialStructure
 
-@dataclass
+@dataclass(slots=True)
 class ExperimentState:
     experiment_state_code: int
     system_state_code: int
@@ -15,19 +15,19 @@ class ExperimentState:
     aversive_recovery_failed_threshold: int = ...
     aversive_recovery_guided_trials: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class BaseTrial(TrialStructure):
     trigger_type: str = ...
     cue_sequence: list[int] = field(default_factory=list)
     trial_length_cm: float = ...
     def validate_zones(self) -> None: ...
 
-@dataclass
+@dataclass(slots=True)
 class WaterRewardTrial(BaseTrial):
     reward_size_ul: float = ...
     reward_tone_duration_ms: int = ...
 
-@dataclass
+@dataclass(slots=True)
 class GasPuffTrial(BaseTrial):
     puff_duration_ms: int = ...
     occupancy_duration_ms: int = ...
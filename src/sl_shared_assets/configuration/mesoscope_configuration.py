@@ -56,11 +56,6 @@ class MesoscopeExperimentConfiguration(YamlConfig):
         """Returns the mapping of cue names to their Cue class instances for all VR cues used in the experiment."""
         return {cue.name: cue for cue in self.cues}
 
-    @property
-    def _cue_name_to_code(self) -> dict[str, int]:
-        """Returns the mapping of cue names to their unique identifier codes for all VR cues used in the experiment."""
-        return {cue.name: cue.code for cue in self.cues}
-
     @property
     def _segment_by_name(self) -> dict[str, Segment]:
         """Returns the mapping of segment names to their Segment class instances for all VR segments used in the
@@ -68,16 +63,15 @@ class MesoscopeExperimentConfiguration(YamlConfig):
         """
         return {seg.name: seg for seg in self.segments}
 
-    def _get_segment_length_cm(self, segment_name: str) -> float:
+    @staticmethod
+    def _get_segment_length_cm(segment: Segment, cue_by_name: dict[str, Cue]) -> float:
         """Returns the total length of the VR segment in centimeters."""
-        segment = self._segment_by_name[segment_name]
-        cue_map = self._cue_by_name
-        return sum(cue_map[cue_name].length_cm for cue_name in segment.cue_sequence)
+        return sum(cue_by_name[cue_name].length_cm for cue_name in segment.cue_sequence)
 
-    def _get_segment_cue_codes(self, segment_name: str) -> list[int]:
+    @staticmethod
+    def _get_segment_cue_codes(segment: Segment, cue_by_name: dict[str, Cue]) -> list[int]:
         """Returns the sequence of cue codes for the specified segment's cue sequence."""
-        segment = self._segment_by_name[segment_name]
-        return [self._cue_name_to_code[name] for name in segment.cue_sequence]
+        return [cue_by_name[cue_name].code for cue_name in segment.cue_sequence]
 
     def __post_init__(self) -> None:
         """Validates experiment configuration and populates derived trial fields."""
@@ -101,33 +95,34 @@ class MesoscopeExperimentConfiguration(YamlConfig):
             )
             console.error(message=message, error=ValueError)
 
+        cue_by_name = self._cue_by_name
+        segment_by_name = self._segment_by_name
+
         # Ensures segment cue sequences reference valid cues.
-        cue_names = {cue.name for cue in self.cues}
         for seg in self.segments:
             for cue_name in seg.cue_sequence:
-                if cue_name not in cue_names:
+                if cue_name not in cue_by_name:
                     message = (
                         f"Segment '{seg.name}' references unknown cue '{cue_name}'. "
-                        f"Available cues: {', '.join(sorted(cue_names))}."
+                        f"Available cues: {', '.join(sorted(cue_by_name))}."
                     )
                     console.error(message=message, error=ValueError)
 
         # Populates the derived trial fields and validates them.
-        segment_names = {seg.name for seg in self.segments}
         for trial_name, trial in self.trial_structures.items():
             # Validates segment reference.
-            if trial.segment_name not in segment_names:
+            segment = segment_by_name.get(trial.segment_name)
+            if segment is None:
                 message = (
                     f"Trial '{trial_name}' references unknown segment '{trial.segment_name}'. "
-                    f"Available segments: {', '.join(sorted(segment_names))}."
+                    f"Available segments: {', '.join(sorted(segment_by_name))}."
                 )
                 console.error(message=message, error=ValueError)
+                raise ValueError(message)  # pragma: no cover
 
-            # Populates cue_sequence from segment.
-            trial.cue_sequence = self._get_segment_cue_codes(trial.segment_name)
-
-            # Populates trial_length_cm from segment.
-            trial.trial_length_cm = self._get_segment_length_cm(trial.segment_name)
+            # Populates cue_sequence and trial_length_cm from segment.
+            trial.cue_sequence = self._get_segment_cue_codes(segment=segment, cue_by_name=cue_by_name)
+            trial.trial_length_cm = self._get_segment_length_cm(segment=segment, cue_by_name=cue_by_name)
 
             # Validates zone positions with populated trial_length_cm.
             trial.validate_zones()
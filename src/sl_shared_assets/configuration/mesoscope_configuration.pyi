@@ -26,11 +26,11 @@ class MesoscopeExperimentConfiguration(YamlConfig):
     @property
     def _cue_by_name(self) -> dict[str, Cue]: ...
     @property
-    def _cue_name_to_code(self) -> dict[str, int]: ...
-    @property
     def _segment_by_name(self) -> dict[str, Segment]: ...
-    def _get_segment_length_cm(self, segment_name: str) -> float: ...
-    def _get_segment_cue_codes(self, segment_name: str) -> list[int]: ...
+    @staticmethod
+    def _get_segment_length_cm(segment: Segment, cue_by_name: dict[str, Cue]) -> float: ...
+    @staticmethod
+    def _get_segment_cue_codes(segment: Segment, cue_by_name: dict[str, Cue]) -> list[int]: ...
     def __post_init__(self) -> None: ...
 
 @dataclass
@@ -35,7 +35,7 @@ _UINT8_MAX: int = 255
 _PROBABILITY_SUM_TOLERANCE: float = 0.001
 
 
-@dataclass
+@dataclass(slots=True)
 class Cue:
     """Defines a single visual cue used in the experiment task's Virtual Reality (VR) environment.
 
@@ -62,7 +62,7 @@ class Cue:
             console.error(message=message, error=ValueError)
 
 
-@dataclass
+@dataclass(slots=True)
 class Segment:
     """Defines a visual segment (sequence of cues) used in the experiment task's Virtual Reality (VR) environment.
 
@@ -111,7 +111,7 @@ class VREnvironment:
     """The conversion factor from centimeters to Unity units."""
 
 
-@dataclass
+@dataclass(slots=True)
 class TrialStructure:
     """Defines the spatial configuration of a trial structure for Unity prefabs.
 
@@ -175,11 +175,10 @@ class TaskTemplate(YamlConfig):
         """
         return {seg.name: seg for seg in self.segments}
 
-    def _get_segment_length_cm(self, segment_name: str) -> float:
+    @staticmethod
+    def _get_segment_length_cm(segment: Segment, cue_by_name: dict[str, Cue]) -> float:
         """Returns the total length of the VR segment in centimeters."""
-        segment = self._segment_by_name[segment_name]
-        cue_map = self._cue_by_name
-        return sum(cue_map[cue_name].length_cm for cue_name in segment.cue_sequence)
+        return sum(cue_by_name[cue_name].length_cm for cue_name in segment.cue_sequence)
 
     def __post_init__(self) -> None:
         """Validates task template configuration."""
@@ -197,27 +196,30 @@ class TaskTemplate(YamlConfig):
             message = f"Duplicate cue names found: {set(duplicate_names)}. Each cue must use a unique name."
             console.error(message=message, error=ValueError)
 
+        cue_by_name = self._cue_by_name
+        segment_by_name = self._segment_by_name
+
         # Ensures segment cue sequences reference valid cues.
-        cue_names = {cue.name for cue in self.cues}
         for seg in self.segments:
             for cue_name in seg.cue_sequence:
-                if cue_name not in cue_names:
+                if cue_name not in cue_by_name:
                     message = (
                         f"Segment '{seg.name}' references unknown cue '{cue_name}'. "
-                        f"Available cues: {', '.join(sorted(cue_names))}."
+                        f"Available cues: {', '.join(sorted(cue_by_name))}."
                     )
                     console.error(message=message, error=ValueError)
 
         # Validates trial structure segment references and trigger types.
-        segment_names = {seg.name for seg in self.segments}
         valid_trigger_types = {t.value for t in TriggerType}
         for trial_name, trial_structure in self.trial_structures.items():
-            if trial_structure.segment_name not in segment_names:
+            segment = segment_by_name.get(trial_structure.segment_name)
+            if segment is None:
                 message = (
                     f"Trial structure '{trial_name}' references unknown segment '{trial_structure.segment_name}'. "
-                    f"Available segments: {', '.join(sorted(segment_names))}."
+                    f"Available segments: {', '.join(sorted(segment_by_name))}."
                 )
                 console.error(message=message, error=ValueError)
+                raise ValueError(message)  # pragma: no cover
 
             # Validates trigger_type values. Accepts both TriggerType enum and string values for YAML compatibility.
             trigger_value = (
@@ -233,7 +235,7 @@ class TaskTemplate(YamlConfig):
                 console.error(message=message, error=ValueError)
 
             # Validates zone positions are within segment bounds.
-            segment_length = self._get_segment_length_cm(trial_structure.segment_name)
+            segment_length = self._get_segment_length_cm(segment=segment, cue_by_name=cue_by_name)
             self._validate_zone_positions(trial_name, trial_structure, segment_length)
 
     @staticmethod
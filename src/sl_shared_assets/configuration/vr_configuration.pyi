@@ -10,14 +10,14 @@ class TriggerType(StrEnum):
 _UINT8_MAX: int
 _PROBABILITY_SUM_TOLERANCE: float
 
-@dataclass
+@dataclass(slots=True)
 class Cue:
     name: str
     code: int
     length_cm: float
     def __post_init__(self) -> None: ...
 
-@dataclass
+@dataclass(slots=True)
 class Segment:
     name: str
     cue_sequence: list[str]
@@ -31,7 +31,7 @@ class VREnvironment:
     padding_prefab_name: str
     cm_per_unity_unit: float
 
-@dataclass
+@dataclass(slots=True)
 class TrialStructure:
     segment_name: str
     stimulus_trigger_zone_start_cm: float
@@ -51,7 +51,8 @@ class TaskTemplate(YamlConfig):
     def _cue_by_name(self) -> dict[str, Cue]: ...
     @property
     def _segment_by_name(self) -> dict[str, Segment]: ...
-    def _get_segment_length_cm(self, segment_name: str) -> float: ...
+    @staticmethod
+    def _get_segment_length_cm(segment: Segment, cue_by_name: dict[str, Cue]) -> float: ...
     def __post_init__(self) -> None: ...
     @staticmethod
     def _validate_zone_positions(trial_name: str, trial_structure: TrialStructure, segment_length: float) -> None: ...
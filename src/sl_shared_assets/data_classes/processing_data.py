@@ -1,16 +1,97 @@
 """Provides assets for running data processing pipelines."""
 
 import os
-import copy
+import sys
 from enum import IntEnum, StrEnum
-from pathlib import Path  # noqa: TC003
+from types import FrameType  # noqa: TC003
+import signal
+from pathlib import Path
+import threading
+from contextlib import contextmanager
 from dataclasses import field, dataclass
+from collections.abc import Iterator  # noqa: TC003
 
 import xxhash
 from filelock import FileLock
-from ataraxis_base_utilities import console
+from ataraxis_base_utilities import console, ensure_directory_exists
 from ataraxis_data_structures import YamlConfig
 
+if sys.platform != "win32":
+    import fcntl
+
+# The maximum time, in seconds, to wait for the tracker's .LOCK file to become available.
+_LOCK_TIMEOUT: float = 10.0
+
+# Caches the FileLock instances used to acquire each .LOCK file on platforms and threads that cannot use the
+# kernel-blocking acquisition path. FileLock instances are reentrant and thread-local, so they can be safely reused.
+_FILE_LOCKS: dict[str, FileLock] = {}
+
+
+@contextmanager
+def _acquire_lock(lock_path: str, timeout: float = _LOCK_TIMEOUT) -> Iterator[None]:
+    """Acquires exclusive access to the target .LOCK file for the duration of the context.
+
+    Notes:
+        On POSIX systems, when called from the main thread, the waiting process blocks inside the kernel until the lock
+        is released, instead of repeatedly polling the lock file. The timeout is enforced via the real-time interval
+        timer (SIGALRM), and the caller's SIGALRM handler is restored after the wait. On Windows, in non-main threads,
+        and when the caller has already armed the real-time interval timer, falls back to the FileLock class, which
+        leaves the caller's timer intact. Both approaches use flock() on POSIX systems, so they remain mutually
+        exclusive.
+
+    Args:
+        lock_path: The path to the .LOCK file to acquire.
+        timeout: The maximum time, in seconds, to wait for the lock to become available.
+
+    Raises:
+        TimeoutError: If the .LOCK file cannot be acquired within the timeout period.
+    """
+    if (
+        sys.platform == "win32"
+        or threading.current_thread() is not threading.main_thread()
+        or signal.getitimer(signal.ITIMER_REAL)[0] > 0
+    ):
+        lock = _FILE_LOCKS.get(lock_path)
+        if lock is None:
+            lock = _FILE_LOCKS.setdefault(lock_path, FileLock(lock_path))
+        with lock.acquire(timeout=timeout):
+            yield
+        return
+
+    try:
+        descriptor = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    except FileNotFoundError:
+        # Creates the missing parent directories of the .LOCK file before retrying.
+        ensure_directory_exists(Path(lock_path))
+        descriptor = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    try:
+        try:
+            # Fast path: acquires the uncontested lock without arming the timeout timer.
+            fcntl.flock(descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+
+            def _abort_wait(_signal_number: int, _frame: FrameType | None) -> None:
+                message = (
+                    f"Unable to acquire the {lock_path} lock file within {timeout} seconds. Another process is "
+                    f"likely holding the lock."
+                )
+                console.error(message=message, error=TimeoutError)
+                # Fallback to appease mypy, should not be reachable
+                raise TimeoutError(message)  # pragma: no cover
+
+            previous_handler = signal.signal(signal.SIGALRM, _abort_wait)
+            previous_timer = signal.setitimer(signal.ITIMER_REAL, timeout)
+            try:
+                fcntl.flock(descriptor, fcntl.LOCK_EX)
+            finally:
+                signal.setitimer(signal.ITIMER_REAL, *previous_timer)
+                signal.signal(signal.SIGALRM, previous_handler)
+        yield
+    finally:
+        # Closing the descriptor releases the lock.
+        os.close(descriptor)
+
 
 class ProcessingPipelines(StrEnum):
     """Defines the data processing pipelines currently supported by the Sun lab data workflow."""
@@ -126,7 +207,7 @@ class ProcessingTracker(YamlConfig):
         """Resolves the .LOCK file for the managed tracker .YAML file."""
         # Generates the .lock file path for the target tracker .yaml file.
         if self.file_path is not None:
-            self.lock_path = str(self.file_path.with_suffix(self.file_path.suffix + ".lock"))
+            self.lock_path = f"{os.fspath(self.file_path)}.lock"
         else:
             self.lock_path = ""
 
@@ -168,7 +249,7 @@ class ProcessingTracker(YamlConfig):
         if self.file_path.exists():
             # Loads the data for the state values but does not replace the file path or lock attributes.
             instance: ProcessingTracker = self.from_yaml(self.file_path)
-            self.jobs = copy.deepcopy(instance.jobs)
+            self.jobs = instance.jobs
         else:
             # Generates a new .yaml file using default instance values and saves it to disk if the tracker file does
             # not exist.
@@ -205,8 +286,7 @@ class ProcessingTracker(YamlConfig):
         Raises:
             TimeoutError: If the .LOCK file for the tracker .YAML file cannot be acquired within the timeout period.
         """
-        lock = FileLock(self.lock_path)
-        with lock.acquire(timeout=10.0):
+        with _acquire_lock(lock_path=self.lock_path):
             # Loads tracker's state from the .yaml file
             self._load_state()
 
@@ -228,8 +308,7 @@ class ProcessingTracker(YamlConfig):
             TimeoutError: If the .LOCK file for the tracker .YAML file cannot be acquired within the timeout period.
             ValueError: If the specified job ID is not found in the managed tracker file.
         """
-        lock = FileLock(self.lock_path)
-        with lock.acquire(timeout=10.0):
+        with _acquire_lock(lock_path=self.lock_path):
             # Loads tracker state from the .yaml file
             self._load_state()
 
@@ -261,8 +340,7 @@ class ProcessingTracker(YamlConfig):
             TimeoutError: If the .LOCK file for the tracker .YAML file cannot be acquired within the timeout period.
             ValueError: If the specified job ID is not found in the managed tracker file.
         """
-        lock = FileLock(self.lock_path)
-        with lock.acquire(timeout=10.0):
+        with _acquire_lock(lock_path=self.lock_path):
             # Loads tracker state from the .yaml file
             self._load_state()
 
@@ -293,8 +371,7 @@ class ProcessingTracker(YamlConfig):
             TimeoutError: If the .LOCK file for the tracker .YAML file cannot be acquired within the timeout period.
             ValueError: If the specified job ID is not found in the managed tracker file.
         """
-        lock = FileLock(self.lock_path)
-        with lock.acquire(timeout=10.0):
+        with _acquire_lock(lock_path=self.lock_path):
             # Loads tracker state from the .yaml file
             self._load_state()
 
@@ -328,8 +405,7 @@ class ProcessingTracker(YamlConfig):
             TimeoutError: If the .LOCK file for the tracker .YAML file cannot be acquired within the timeout period.
             ValueError: If the specified job ID is not found in the managed tracker file.
         """
-        lock = FileLock(self.lock_path)
-        with lock.acquire(timeout=10.0):
+        with _acquire_lock(lock_path=self.lock_path):
             self._load_state()
 
             # Verifies that the tracker is configured to track the specified job
@@ -347,8 +423,7 @@ class ProcessingTracker(YamlConfig):
 
     def reset(self) -> None:
         """Resets the tracker file to the default state."""
-        lock = FileLock(self.lock_path)
-        with lock.acquire(timeout=10.0):
+        with _acquire_lock(lock_path=self.lock_path):
             # Loads tracker state from the .yaml file.
             self._load_state()
 
@@ -363,8 +438,7 @@ class ProcessingTracker(YamlConfig):
         Notes:
             The pipeline is considered complete if all jobs have been marked as succeeded.
         """
-        lock = FileLock(self.lock_path)
-        with lock.acquire(timeout=10.0):
+        with _acquire_lock(lock_path=self.lock_path):
             self._load_state()
             if not self.jobs:
                 return False
@@ -377,7 +451,6 @@ class ProcessingTracker(YamlConfig):
         Notes:
             The pipeline is considered to have encountered an error if any job has been marked as failed.
         """
-        lock = FileLock(self.lock_path)
-        with lock.acquire(timeout=10.0):
+        with _acquire_lock(lock_path=self.lock_path):
             self._load_state()
             return any(job.status == ProcessingStatus.FAILED for job in self.jobs.values())
@@ -1,9 +1,18 @@
 from enum import IntEnum, StrEnum
 from pathlib import Path
+from contextlib import contextmanager
 from dataclasses import field, dataclass
+from collections.abc import Iterator
 
+from filelock import FileLock
 from ataraxis_data_structures import YamlConfig
 
+_LOCK_TIMEOUT: float
+_FILE_LOCKS: dict[str, FileLock]
+
+@contextmanager
+def _acquire_lock(lock_path: str, timeout: float = ...) -> Iterator[None]: ...
+
 class ProcessingPipelines(StrEnum):
     MANIFEST = "manifest"
     ADOPTION = "adoption"
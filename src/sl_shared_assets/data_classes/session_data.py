@@ -2,13 +2,16 @@
 machines.
 """
 
+import os
 import copy
 from enum import StrEnum
 import shutil
+from typing import ClassVar
 from pathlib import Path
+from collections import OrderedDict
 from dataclasses import field, dataclass
 
-from ataraxis_base_utilities import console, ensure_directory_exists
+from ataraxis_base_utilities import console
 from ataraxis_data_structures import YamlConfig
 from ataraxis_time.time_helpers import TimestampFormats, get_timestamp
 
@@ -30,7 +33,20 @@ class SessionTypes(StrEnum):
     experiment sessions using the Mesoscope."""
 
 
-@dataclass
+# Stores the values of all supported session types. Used to validate session types without iterating the enumeration.
+_VALID_SESSION_TYPES: frozenset[str] = frozenset(session_type.value for session_type in SessionTypes)
+
+# The maximum number of parsed session_data.yaml files kept in the in-process load cache.
+_SESSION_DATA_CACHE_SIZE: int = 256
+
+# Maps the loading class and the path of each recently loaded session_data.yaml file to the (modification time, size)
+# stamp of the file and the instance parsed from it. Keying on the class ensures that SessionData and its subclasses
+# never receive each other's instances. Used to avoid re-parsing unchanged files when the same session is loaded
+# multiple times by the same process. Entries are evicted in the least-recently-used order.
+_SESSION_DATA_CACHE: OrderedDict[tuple[type[SessionData], str], tuple[tuple[int, int], SessionData]] = OrderedDict()
+
+
+@dataclass(slots=True)
 class RawData:
     """Provides the paths to the directories and files that store the data acquired and losslessly preprocessed during
     the session's data acquisition runtime.
@@ -78,38 +94,46 @@ class RawData:
     """The path to the nk.bin file used by the sl-experiment library to mark sessions undergoing runtime initialization.
     """
 
+    _PATH_SPECS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("camera_data_path", "camera_data"),
+        ("mesoscope_data_path", "mesoscope_data"),
+        ("behavior_data_path", "behavior_data"),
+        ("zaber_positions_path", "zaber_positions.yaml"),
+        ("session_descriptor_path", "session_descriptor.yaml"),
+        ("hardware_state_path", "hardware_state.yaml"),
+        ("surgery_metadata_path", "surgery_metadata.yaml"),
+        ("session_data_path", "session_data.yaml"),
+        ("experiment_configuration_path", "experiment_configuration.yaml"),
+        ("mesoscope_positions_path", "mesoscope_positions.yaml"),
+        ("window_screenshot_path", "window_screenshot.png"),
+        ("checksum_path", "ax_checksum.txt"),
+        ("system_configuration_path", "system_configuration.yaml"),
+        ("nk_path", "nk.bin"),
+    )
+    """Maps the names of the managed path attributes to their locations relative to the raw data root directory."""
+
     def resolve_paths(self, root_directory_path: Path) -> None:
         """Resolves all paths managed by the class instance based on the input root directory path.
 
         Args:
             root_directory_path: The path to the top-level raw data directory of the session's data hierarchy.
         """
-        # Generates the managed paths
+        # Generates the managed paths. Builds each path from a pre-formatted string prefix, which is cheaper than
+        # joining Path objects for every managed path.
         self.raw_data_path = root_directory_path
-        self.camera_data_path = self.raw_data_path.joinpath("camera_data")
-        self.mesoscope_data_path = self.raw_data_path.joinpath("mesoscope_data")
-        self.behavior_data_path = self.raw_data_path.joinpath("behavior_data")
-        self.zaber_positions_path = self.raw_data_path.joinpath("zaber_positions.yaml")
-        self.session_descriptor_path = self.raw_data_path.joinpath("session_descriptor.yaml")
-        self.hardware_state_path = self.raw_data_path.joinpath("hardware_state.yaml")
-        self.surgery_metadata_path = self.raw_data_path.joinpath("surgery_metadata.yaml")
-        self.session_data_path = self.raw_data_path.joinpath("session_data.yaml")
-        self.experiment_configuration_path = self.raw_data_path.joinpath("experiment_configuration.yaml")
-        self.mesoscope_positions_path = self.raw_data_path.joinpath("mesoscope_positions.yaml")
-        self.window_screenshot_path = self.raw_data_path.joinpath("window_screenshot.png")
-        self.checksum_path = self.raw_data_path.joinpath("ax_checksum.txt")
-        self.system_configuration_path = self.raw_data_path.joinpath("system_configuration.yaml")
-        self.nk_path = self.raw_data_path.joinpath("nk.bin")
+        prefix = str(root_directory_path) + os.sep
+        for attribute, suffix in self._PATH_SPECS:
+            setattr(self, attribute, Path(prefix + suffix))
 
     def make_directories(self) -> None:
         """Ensures that all major subdirectories and the root directory exist, creating any missing directories."""
-        ensure_directory_exists(self.raw_data_path)
-        ensure_directory_exists(self.camera_data_path)
-        ensure_directory_exists(self.mesoscope_data_path)
-        ensure_directory_exists(self.behavior_data_path)
+        # Since all managed subdirectories are stored under the root directory, creating the subdirectories also
+        # creates the root directory.
+        for directory in (self.camera_data_path, self.mesoscope_data_path, self.behavior_data_path):
+            directory.mkdir(parents=True, exist_ok=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedData:
     """Provides the paths to the directories and files that store the data generated by the processing pipelines from
     the raw data.
@@ -127,6 +151,14 @@ class ProcessedData:
     """The path to the directory that contains the non-video behavior data extracted from the .npz log archives by the 
     sl-behavior log processing pipeline."""
 
+    _PATH_SPECS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("camera_data_path", "camera_data"),
+        ("mesoscope_data_path", "mesoscope_data"),
+        ("behavior_data_path", "behavior_data"),
+    )
+    """Maps the names of the managed path attributes to their locations relative to the processed data root
+    directory."""
+
     def resolve_paths(self, root_directory_path: Path) -> None:
         """Resolves all paths managed by the class instance based on the input root directory path.
 
@@ -135,19 +167,19 @@ class ProcessedData:
         """
         # Generates the managed paths
         self.processed_data_path = root_directory_path
-        self.camera_data_path = self.processed_data_path.joinpath("camera_data")
-        self.mesoscope_data_path = self.processed_data_path.joinpath("mesoscope_data")
-        self.behavior_data_path = self.processed_data_path.joinpath("behavior_data")
+        prefix = str(root_directory_path) + os.sep
+        for attribute, suffix in self._PATH_SPECS:
+            setattr(self, attribute, Path(prefix + suffix))
 
     def make_directories(self) -> None:
         """Ensures that all major subdirectories and the root directory exist, creating any missing directories."""
-        ensure_directory_exists(self.processed_data_path)
-        ensure_directory_exists(self.camera_data_path)
-        ensure_directory_exists(self.behavior_data_path)
-        ensure_directory_exists(self.mesoscope_data_path)
+        # Since all managed subdirectories are stored under the root directory, creating the subdirectories also
+        # creates the root directory.
+        for directory in (self.camera_data_path, self.behavior_data_path, self.mesoscope_data_path):
+            directory.mkdir(parents=True, exist_ok=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackingData:
     """Provides the path to the directory that stores the .yaml and .lock files used by ProcessingTracker instances to
     track the runtime status of the data processing pipelines working with the session's data.
@@ -167,7 +199,7 @@ class TrackingData:
 
     def make_directories(self) -> None:
         """Ensures that all major subdirectories and the root directory exist, creating any missing directories."""
-        ensure_directory_exists(self.tracking_data_path)
+        self.tracking_data_path.mkdir(parents=True, exist_ok=True)
 
 
 @dataclass
@@ -203,15 +235,22 @@ class SessionData(YamlConfig):
     """The Python version used to acquire session's data."""
     sl_experiment_version: str = "3.0.0"
     """The sl-experiment library version used to acquire the session's data."""
-    raw_data: RawData = field(default_factory=lambda: RawData())
+    raw_data: RawData = field(default_factory=RawData)
     """Defines the session's raw data hierarchy."""
-    processed_data: ProcessedData = field(default_factory=lambda: ProcessedData())
+    processed_data: ProcessedData = field(default_factory=ProcessedData)
     """Defines the session's processed data hierarchy."""
-    tracking_data: TrackingData = field(default_factory=lambda: TrackingData())
+    tracking_data: TrackingData = field(default_factory=TrackingData)
     """Defines the session's tracking data hierarchy."""
 
     def __post_init__(self) -> None:
         """Ensures that all instances used to define the session's data hierarchy are properly initialized."""
+        # Ensures enumeration-mapped arguments are stored as proper enumeration types. Since enumeration members are
+        # singletons, this also deduplicates the values shared by all loaded sessions.
+        if isinstance(self.session_type, str):
+            self.session_type = SessionTypes(self.session_type)
+        if isinstance(self.acquisition_system, str):
+            self.acquisition_system = AcquisitionSystems(self.acquisition_system)
+
         if not isinstance(self.raw_data, RawData):
             self.raw_data = RawData()  # pragma: no cover
 
@@ -248,7 +287,7 @@ class SessionData(YamlConfig):
         Returns:
             An initialized SessionData instance that stores the structure and the metadata of the created session.
         """
-        if session_type not in SessionTypes:
+        if str(session_type) not in _VALID_SESSION_TYPES:
             message = (
                 f"Invalid session type '{session_type}' encountered when initializing a new data acquisition session. "
                 f"Use one of the supported session types from the SessionTypes enumeration."
@@ -262,11 +301,12 @@ class SessionData(YamlConfig):
         # by the machine (PC) that calls this method.
         acquisition_system = get_system_configuration_data()
 
-        # Constructs the root session directory path
-        session_path = acquisition_system.filesystem.root_directory.joinpath(project_name, animal_id, session_name)
+        # Constructs the root project and session directory paths
+        project_path = acquisition_system.filesystem.root_directory.joinpath(project_name)
+        session_path = project_path.joinpath(animal_id, session_name)
 
         # Prevents creating new sessions for non-existent projects.
-        if not acquisition_system.filesystem.root_directory.joinpath(project_name).exists():
+        if not project_path.is_dir():
             message = (
                 f"Unable to initialize a new data acquisition session {session_name} for the animal '{animal_id}' and "
                 f"project '{project_name}'. The project does not exist on the local machine (PC). Use the "
@@ -304,9 +344,7 @@ class SessionData(YamlConfig):
 
         if experiment_name is not None:
             # Copies the experiment_configuration.yaml file to the session's directory
-            experiment_configuration_path = acquisition_system.filesystem.root_directory.joinpath(
-                project_name, "configuration", f"{experiment_name}.yaml"
-            )
+            experiment_configuration_path = project_path.joinpath("configuration", f"{experiment_name}.yaml")
             shutil.copy2(experiment_configuration_path, instance.raw_data.experiment_configuration_path)
 
         # All newly created sessions are marked with the 'nk.bin' file. If the marker is not removed during runtime,
@@ -334,38 +372,60 @@ class SessionData(YamlConfig):
         Raises:
             FileNotFoundError: If multiple or no 'session_data.yaml' file instances are found under the input directory.
         """
-        # To properly initialize the SessionData instance, the provided path should contain a single session_data.yaml
-        # file at any hierarchy level.
-        session_data_files = list(session_path.rglob("session_data.yaml"))
-        if len(session_data_files) != 1:
-            message = (
-                f"Unable to load the target session's data. Expected a single session_data.yaml file to be located "
-                f"under the directory tree specified by the input path: {session_path}. Instead, encountered "
-                f"{len(session_data_files)} candidate files. This indicates that the input path does not point to a "
-                f"valid session data hierarchy."
-            )
-            console.error(message=message, error=FileNotFoundError)
-
-        # If a single candidate is found (as expected), extracts it from the list and uses it to resolve the
-        # session data hierarchy.
-        session_data_path = session_data_files.pop()
-
-        # Loads the session's data from the.yaml file
-        instance: SessionData = cls.from_yaml(file_path=session_data_path)
+        # Checks the two standard locations of the session_data.yaml file first. This avoids walking the entire session
+        # directory tree, which may contain many thousands of data files, when the input path points to the session's
+        # root or raw_data directory.
+        session_data_path = session_path.joinpath("raw_data", "session_data.yaml")
+        if not session_data_path.is_file():
+            session_data_path = session_path.joinpath("session_data.yaml")
+
+        if not session_data_path.is_file():
+            # Otherwise, to properly initialize the SessionData instance, the provided path should contain a single
+            # session_data.yaml file at any hierarchy level.
+            session_data_files = list(session_path.rglob("session_data.yaml"))
+            if len(session_data_files) != 1:
+                message = (
+                    f"Unable to load the target session's data. Expected a single session_data.yaml file to be "
+                    f"located under the directory tree specified by the input path: {session_path}. Instead, "
+                    f"encountered {len(session_data_files)} candidate files. This indicates that the input path does "
+                    f"not point to a valid session data hierarchy."
+                )
+                console.error(message=message, error=FileNotFoundError)
+
+            # If a single candidate is found (as expected), extracts it from the list and uses it to resolve the
+            # session data hierarchy.
+            session_data_path = session_data_files.pop()
+
+        # Loads the session's data from the .yaml file. If the same file was loaded before and has not been modified
+        # since, reuses the cached data instead of re-parsing the file.
+        stat = session_data_path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cache_key = (cls, str(session_data_path))
+        cached = _SESSION_DATA_CACHE.get(cache_key)
+        if cached is not None and cached[0] == stamp:
+            _SESSION_DATA_CACHE.move_to_end(cache_key)
+            instance: SessionData = copy.deepcopy(cached[1])
+        else:
+            instance = cls.from_yaml(file_path=session_data_path)
+            _SESSION_DATA_CACHE[cache_key] = (stamp, copy.deepcopy(instance))
+            _SESSION_DATA_CACHE.move_to_end(cache_key)
+            if len(_SESSION_DATA_CACHE) > _SESSION_DATA_CACHE_SIZE:
+                _SESSION_DATA_CACHE.popitem(last=False)
 
         # The method assumes that the 'donor' YAML file is always stored inside the raw_data directory of the session
         # to be processed. Uses this heuristic to get the path to the root session's directory.
-        local_root = session_data_path.parents[1]
+        # Walks up the hierarchy directly, instead of indexing the 'parents' sequence.
+        local_root = session_data_path.parent.parent
 
         # RAW DATA
-        instance.raw_data.resolve_paths(root_directory_path=local_root.joinpath(local_root, "raw_data"))
+        instance.raw_data.resolve_paths(root_directory_path=local_root.joinpath("raw_data"))
 
         # PROCESSED DATA
-        instance.processed_data.resolve_paths(root_directory_path=local_root.joinpath(local_root, "processed_data"))
+        instance.processed_data.resolve_paths(root_directory_path=local_root.joinpath("processed_data"))
         instance.processed_data.make_directories()  # Ensures that processed data hierarchy exists.
 
         # TRACKING DATA
-        instance.tracking_data.resolve_paths(root_directory_path=local_root.joinpath(local_root, "tracking_data"))
+        instance.tracking_data.resolve_paths(root_directory_path=local_root.joinpath("tracking_data"))
         instance.tracking_data.make_directories()  # Ensures tracking data directories exist
 
         # Returns the initialized SessionData instance to caller
@@ -382,9 +442,10 @@ class SessionData(YamlConfig):
 
     def save(self) -> None:
         """Caches the instance's data to the session's 'raw_data' directory as a 'session_data.yaml' file."""
-        # Generates a copy of the original class to avoid modifying the instance that will be used for further
-        # processing.
-        origin = copy.deepcopy(self)
+        # Generates a shallow copy of the original class to avoid modifying the instance that will be used for further
+        # processing. Since the fields of the copy are only reassigned (not modified in place) below, a shallow copy is
+        # sufficient and avoids deep-copying the entire session data hierarchy.
+        origin = copy.copy(self)
 
         # Resets all path fields to Null (None) before saving the instance to disk.
         origin.raw_data = None  # type: ignore[assignment]
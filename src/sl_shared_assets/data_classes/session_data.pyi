@@ -1,5 +1,7 @@
 from enum import StrEnum
+from typing import ClassVar
 from pathlib import Path
+from collections import OrderedDict
 from dataclasses import field, dataclass
 
 from _typeshed import Incomplete
@@ -16,7 +18,11 @@ class SessionTypes(StrEnum):
     MESOSCOPE_EXPERIMENT = "mesoscope experiment"
     WINDOW_CHECKING = "window checking"
 
-@dataclass
+_VALID_SESSION_TYPES: frozenset[str]
+_SESSION_DATA_CACHE_SIZE: int
+_SESSION_DATA_CACHE: OrderedDict[tuple[type[SessionData], str], tuple[tuple[int, int], SessionData]]
+
+@dataclass(slots=True)
 class RawData:
     raw_data_path: Path = ...
     camera_data_path: Path = ...
@@ -33,19 +39,21 @@ class RawData:
     system_configuration_path: Path = ...
     checksum_path: Path = ...
     nk_path: Path = ...
+    _PATH_SPECS: ClassVar[tuple[tuple[str, str], ...]]
     def resolve_paths(self, root_directory_path: Path) -> None: ...
     def make_directories(self) -> None: ...
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedData:
     processed_data_path: Path = ...
     camera_data_path: Path = ...
     mesoscope_data_path: Path = ...
     behavior_data_path: Path = ...
+    _PATH_SPECS: ClassVar[tuple[tuple[str, str], ...]]
     def resolve_paths(self, root_directory_path: Path) -> None: ...
     def make_directories(self) -> None: ...
 
-@dataclass
+@dataclass(slots=True)
 class TrackingData:
     tracking_data_path: Path = ...
     def resolve_paths(self, root_directory_path: Path) -> None: ...
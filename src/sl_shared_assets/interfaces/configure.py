@@ -7,7 +7,6 @@ from pathlib import Path  # pragma: no cover
 import click  # pragma: no cover
 from ataraxis_base_utilities import LogLevel, console, ensure_directory_exists  # pragma: no cover
 
-from .mcp_server import run_server  # pragma: no cover
 from ..configuration import (
     GasPuffTrial,
     TaskTemplate,
@@ -293,11 +292,14 @@ def generate_experiment_configuration_file(
         default_occupancy_duration_ms=occupancy_duration,
     )
 
-    # Determines trial type counts for guidance parameters.
-    water_reward_count = sum(
-        1 for t in experiment_configuration.trial_structures.values() if isinstance(t, WaterRewardTrial)
-    )
-    gas_puff_count = sum(1 for t in experiment_configuration.trial_structures.values() if isinstance(t, GasPuffTrial))
+    # Determines trial type counts for guidance parameters in a single pass over the trial structures.
+    water_reward_count = 0
+    gas_puff_count = 0
+    for trial in experiment_configuration.trial_structures.values():
+        if isinstance(trial, WaterRewardTrial):
+            water_reward_count += 1
+        elif isinstance(trial, GasPuffTrial):
+            gas_puff_count += 1
 
     # Generates experiment states with guidance parameters.
     for state_num in range(state_count):
@@ -333,4 +335,8 @@ def generate_experiment_configuration_file(
 )
 def start_mcp_server(transport: str) -> None:  # pragma: no cover
     """Starts the MCP server for agentic configuration management."""
+    # Imports the MCP server only when it is requested, as importing the MCP framework noticeably slows down the startup
+    # of all other 'sl-configure' commands.
+    from .mcp_server import run_server  # noqa: PLC0415
+
     run_server(transport=transport)  # type: ignore[arg-type]
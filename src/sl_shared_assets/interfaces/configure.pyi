@@ -2,7 +2,6 @@ from pathlib import Path
 
 from _typeshed import Incomplete
 
-from .mcp_server import run_server as run_server
 from ..configuration import (
     GasPuffTrial as GasPuffTrial,
     TaskTemplate as TaskTemplate,
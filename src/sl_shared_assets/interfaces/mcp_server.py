@@ -4,8 +4,10 @@ This module exposes tools that enable AI agents to manage shared configuration a
 acquisition systems.
 """
 
+import os
 from typing import Literal
 from pathlib import Path
+from collections import OrderedDict
 
 from mcp.server.fastmcp import FastMCP
 
@@ -24,6 +26,75 @@ from ..configuration import (
 # Initializes the MCP server with JSON response mode for structured output.
 mcp = FastMCP(name="sl-shared-assets", json_response=True)
 
+# Maps the paths to the previously scanned task templates directories to the (inode, modification time) stamp of each
+# directory and the names of the templates found inside it. Since adding, removing, or renaming files updates the
+# directory's modification time, the stamp is sufficient to detect changes to the set of available templates.
+_TEMPLATE_NAMES_CACHE: dict[str, tuple[tuple[int, int], tuple[str, ...]]] = {}
+
+# The maximum number of parsed task templates kept in the in-process template cache.
+_TEMPLATE_CACHE_SIZE: int = 64
+
+# Maps the paths to the recently loaded task template files to the (modification time, size) stamp of each file and the
+# TaskTemplate instance parsed from it. Entries are evicted in the least-recently-used order.
+_TEMPLATE_CACHE: OrderedDict[str, tuple[tuple[int, int], TaskTemplate]] = OrderedDict()
+
+
+def _list_template_names(templates_directory: Path) -> tuple[str, ...]:
+    """Resolves the names of all task templates stored in the target templates directory.
+
+    Notes:
+        If the directory was not modified since it was last scanned by this process, returns the previously resolved
+        template names without re-scanning the directory.
+
+    Args:
+        templates_directory: The path to the task templates directory.
+
+    Returns:
+        A tuple that stores the alphabetically sorted names (without the .yaml extension) of all available templates.
+    """
+    stat = templates_directory.stat()
+    stamp = (stat.st_ino, stat.st_mtime_ns)
+    cache_key = os.fspath(templates_directory)
+    cached = _TEMPLATE_NAMES_CACHE.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    # Uses plain file name comparisons on the scanned directory entries, which avoids creating a Path object for every
+    # entry while matching the same entries as the '*.yaml' glob pattern.
+    with os.scandir(templates_directory) as entries:
+        names = tuple(sorted(entry.name[:-5] for entry in entries if entry.name.endswith(".yaml")))
+    _TEMPLATE_NAMES_CACHE[cache_key] = (stamp, names)
+    return names
+
+
+def _load_template(template_path: Path) -> TaskTemplate:
+    """Loads the target task template .yaml file as a TaskTemplate instance.
+
+    Notes:
+        If the file was not modified since it was last loaded by this process, returns the previously loaded instance
+        without re-parsing the file. The returned instance is shared between calls and must not be modified.
+
+    Args:
+        template_path: The path to the task template .yaml file.
+
+    Returns:
+        The TaskTemplate instance that stores the loaded template data.
+    """
+    stat = template_path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cache_key = os.fspath(template_path)
+    cached = _TEMPLATE_CACHE.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        _TEMPLATE_CACHE.move_to_end(cache_key)
+        return cached[1]
+
+    template = TaskTemplate.from_yaml(file_path=template_path)
+    _TEMPLATE_CACHE[cache_key] = (stamp, template)
+    _TEMPLATE_CACHE.move_to_end(cache_key)
+    if len(_TEMPLATE_CACHE) > _TEMPLATE_CACHE_SIZE:
+        _TEMPLATE_CACHE.popitem(last=False)
+    return template
+
 
 @mcp.tool()
 def get_working_directory_tool() -> str:
@@ -94,7 +165,7 @@ def list_available_templates_tool() -> str:
     """
     try:
         templates_dir = get_task_templates_directory()
-        templates = sorted([f.stem for f in templates_dir.glob("*.yaml")])
+        templates = _list_template_names(templates_directory=templates_dir)
     except FileNotFoundError as e:
         return f"Error: {e}"
     else:
@@ -116,11 +187,13 @@ def get_template_info_tool(template_name: str) -> str:
     try:
         templates_dir = get_task_templates_directory()
         template_path = templates_dir.joinpath(f"{template_name}.yaml")
-        if not template_path.exists():
-            available = sorted([f.stem for f in templates_dir.glob("*.yaml")])
-            return f"Error: Template '{template_name}' not found. Available: {', '.join(available)}"
 
-        template = TaskTemplate.from_yaml(file_path=template_path)
+        # Attempts to load the template directly and only scans the templates directory if the template does not exist.
+        try:
+            template = _load_template(template_path=template_path)
+        except FileNotFoundError:
+            available = _list_template_names(templates_directory=templates_dir)
+            return f"Error: Template '{template_name}' not found. Available: {', '.join(available)}"
 
         cue_summary = ", ".join([f"{c.name}(code={c.code})" for c in template.cues])
         segment_summary = ", ".join([s.name for s in template.segments])
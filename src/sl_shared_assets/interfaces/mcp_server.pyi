@@ -1,4 +1,6 @@
 from typing import Literal
+from pathlib import Path
+from collections import OrderedDict
 
 from _typeshed import Incomplete
 
@@ -12,7 +14,12 @@ from ..configuration import (
 )
 
 mcp: Incomplete
+_TEMPLATE_NAMES_CACHE: dict[str, tuple[tuple[int, int], tuple[str, ...]]]
+_TEMPLATE_CACHE_SIZE: int
+_TEMPLATE_CACHE: OrderedDict[str, tuple[tuple[int, int], TaskTemplate]]
 
+def _list_template_names(templates_directory: Path) -> tuple[str, ...]: ...
+def _load_template(template_path: Path) -> TaskTemplate: ...
 def get_working_directory_tool() -> str: ...
 def get_server_configuration_tool() -> str: ...
 def get_google_credentials_tool() -> str: ...
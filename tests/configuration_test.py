@@ -1351,6 +1351,32 @@ def test_get_system_configuration_data_valve_calibration_tuple(
     assert all(isinstance(item, tuple) for item in loaded_config.microcontrollers.valve_calibration_data)
 
 
+def test_get_system_configuration_data_reloads_modified_config(
+    clean_working_directory, sample_mesoscope_config, monkeypatch
+):
+    """Verifies that get_system_configuration_data returns independent copies and reloads modified files.
+
+    This test ensures the configuration cache does not return stale or shared configuration data.
+    """
+    app_dir = clean_working_directory.parent / "app_data"
+    monkeypatch.setattr(appdirs, "user_data_dir", lambda appname, appauthor: str(app_dir))
+
+    set_working_directory(clean_working_directory)
+
+    config_path = clean_working_directory / "configuration" / "mesoscope_system_configuration.yaml"
+    sample_mesoscope_config.save(path=config_path)
+
+    # Modifying the returned instance does not affect subsequent calls
+    first_config = get_system_configuration_data()
+    first_config.sheets.surgery_sheet_id = "modified"
+    assert get_system_configuration_data().sheets.surgery_sheet_id == "abc123"
+
+    # Overwriting the configuration file invalidates the cached data
+    sample_mesoscope_config.sheets.surgery_sheet_id = "updated_sheet_id"
+    sample_mesoscope_config.save(path=config_path)
+    assert get_system_configuration_data().sheets.surgery_sheet_id == "updated_sheet_id"
+
+
 # Tests for ServerConfiguration dataclass
 
 
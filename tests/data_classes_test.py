@@ -1,6 +1,10 @@
 """Contains tests for classes and methods provided by the data_classes module."""
 
+import os
+import time
+import signal
 from pathlib import Path
+import threading
 
 import pytest
 import appdirs
@@ -25,6 +29,7 @@ from sl_shared_assets.configuration import (
     MesoscopeSystemConfiguration,
     set_working_directory,
 )
+from sl_shared_assets.data_classes.processing_data import _acquire_lock
 
 
 @pytest.fixture
@@ -548,6 +553,67 @@ tracking_data: null
     assert loaded_session.tracking_data.tracking_data_path.exists()
 
 
+def test_session_data_load_reloads_modified_session_data_yaml(sample_session_hierarchy):
+    """Verifies that load() returns independent instances and re-reads modified session_data.yaml files.
+
+    This test ensures the in-process load cache does not return stale or shared session data.
+    """
+    session_data_path = sample_session_hierarchy / "raw_data" / "session_data.yaml"
+    session_data_content = """
+project_name: test_project
+animal_id: test_animal
+session_name: 2024-01-15-12-30-45-123456
+session_type: lick training
+acquisition_system: mesoscope
+python_version: "3.11.13"
+sl_experiment_version: "3.0.0"
+raw_data: null
+processed_data: null
+tracking_data: null
+"""
+    session_data_path.write_text(session_data_content)
+
+    # Modifying the loaded instance does not affect subsequent loads
+    first_session = SessionData.load(session_path=sample_session_hierarchy)
+    first_session.experiment_name = "modified"
+    assert SessionData.load(session_path=sample_session_hierarchy).experiment_name is None
+
+    # Overwriting the session_data.yaml file invalidates the cached data
+    session_data_path.write_text(session_data_content.replace("lick training", "mesoscope experiment"))
+    loaded_session = SessionData.load(session_path=sample_session_hierarchy)
+    assert loaded_session.session_type == SessionTypes.MESOSCOPE_EXPERIMENT
+    assert loaded_session.processed_data.processed_data_path.exists()
+
+
+def test_session_data_load_separates_subclass_instances(sample_session_hierarchy):
+    """Verifies that load() returns instances of the class it is called on when subclasses load the same file.
+
+    This test ensures the in-process load cache does not share instances between SessionData and its subclasses.
+    """
+
+    class ExtendedSessionData(SessionData):
+        """Extends SessionData without adding new fields."""
+
+    session_data_path = sample_session_hierarchy / "raw_data" / "session_data.yaml"
+    session_data_content = """
+project_name: test_project
+animal_id: test_animal
+session_name: 2024-01-15-12-30-45-123456
+session_type: lick training
+acquisition_system: mesoscope
+python_version: "3.11.13"
+sl_experiment_version: "3.0.0"
+raw_data: null
+processed_data: null
+tracking_data: null
+"""
+    session_data_path.write_text(session_data_content)
+
+    assert type(ExtendedSessionData.load(session_path=sample_session_hierarchy)) is ExtendedSessionData
+    assert type(SessionData.load(session_path=sample_session_hierarchy)) is SessionData
+    assert type(ExtendedSessionData.load(session_path=sample_session_hierarchy)) is ExtendedSessionData
+
+
 def test_session_data_runtime_initialized_removes_nk_file(sample_session_hierarchy):
     """Verifies that runtime_initialized() removes the nk.bin file.
 
@@ -1176,6 +1242,178 @@ def test_processing_tracker_yaml_serialization(tmp_path):
     assert tracker2.jobs[job_ids[1]].status == ProcessingStatus.SCHEDULED
 
 
+def test_processing_tracker_detects_external_modifications(tmp_path):
+    """Verifies that the tracker re-reads the .YAML file when it is modified outside the tracker's process.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory path.
+
+    This test ensures status queries always reflect external changes to the tracker file.
+    """
+    tracker_file = tmp_path / "tracker.yaml"
+    tracker = ProcessingTracker(file_path=tracker_file)
+
+    session_path = Path("/data/session")
+    job_id = ProcessingTracker.generate_job_id(session_path, "test_job")
+    tracker.initialize_jobs(job_ids=[job_id])
+
+    # Simulates another process marking the job as failed by rewriting the tracker file directly.
+    tracker_file.write_text(
+        f"jobs:\n  {job_id}:\n    status: 3\n    slurm_job_id: 42\nfile_path: null\nlock_path: null\n"
+    )
+
+    assert tracker.get_job_status(job_id) == ProcessingStatus.FAILED
+    assert tracker.jobs[job_id].slurm_job_id == 42
+
+
+def test_processing_tracker_preserves_external_updates_with_unchanged_stamp(tmp_path):
+    """Verifies that modifying the tracker preserves external updates that do not change the file's modification stamp.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory path.
+
+    This test ensures that state modifications are always based on the state stored in the tracker file, even on
+    filesystems with coarse modification timestamps.
+    """
+    tracker_file = tmp_path / "tracker.yaml"
+    tracker = ProcessingTracker(file_path=tracker_file)
+
+    session_path = Path("/data/session")
+    job_ids = [
+        ProcessingTracker.generate_job_id(session_path, "job1"),
+        ProcessingTracker.generate_job_id(session_path, "job2"),
+    ]
+    tracker.initialize_jobs(job_ids=job_ids)
+    tracker.start_job(job_ids[0])
+
+    # Simulates another process starting the second job (the only SCHEDULED job) without changing the file's size or
+    # modification time.
+    stat = tracker_file.stat()
+    content = tracker_file.read_text()
+    assert content.count("status: 0") == 1
+    tracker_file.write_text(content.replace("status: 0", "status: 1"))
+    os.utime(tracker_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert tracker_file.stat().st_size == stat.st_size
+
+    tracker.complete_job(job_ids[0])
+
+    reloaded = ProcessingTracker(file_path=tracker_file)
+    reloaded._load_state()
+    assert reloaded.jobs[job_ids[0]].status == ProcessingStatus.SUCCEEDED
+    assert reloaded.jobs[job_ids[1]].status == ProcessingStatus.RUNNING
+
+
+# Tests for the _acquire_lock function
+
+
+@pytest.fixture
+def held_lock(tmp_path):
+    """Acquires a tracker .LOCK file from a separate file descriptor for the duration of the test.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory path.
+
+    Yields:
+        A tuple of the path to the held .LOCK file and the callable that releases the lock.
+    """
+    fcntl = pytest.importorskip("fcntl")
+    lock_path = tmp_path / "tracker.yaml.lock"
+    descriptor = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    fcntl.flock(descriptor, fcntl.LOCK_EX)
+    yield str(lock_path), lambda: fcntl.flock(descriptor, fcntl.LOCK_UN)
+    os.close(descriptor)
+
+
+def test_acquire_lock_waits_for_release(held_lock):
+    """Verifies that _acquire_lock blocks until the contended .LOCK file is released.
+
+    Args:
+        held_lock: Fixture providing the path to a held .LOCK file and the callable that releases it.
+
+    This test ensures the blocking acquisition path succeeds once the lock is released.
+    """
+    lock_path, release = held_lock
+    released = threading.Event()
+
+    def _release() -> None:
+        # Marks the lock as released before releasing it, so that the acquisition cannot observe the unset event.
+        released.set()
+        release()
+
+    releaser = threading.Timer(interval=0.2, function=_release)
+    releaser.start()
+    with _acquire_lock(lock_path=lock_path, timeout=5.0):
+        assert released.is_set()
+    releaser.join()
+
+
+def test_acquire_lock_timeout(held_lock):
+    """Verifies that _acquire_lock raises TimeoutError and restores the SIGALRM state when the lock is not released.
+
+    Args:
+        held_lock: Fixture providing the path to a held .LOCK file and the callable that releases it.
+
+    This test ensures the timeout is enforced without leaking the interval timer or the signal handler.
+    """
+    lock_path, _ = held_lock
+    previous_handler = signal.getsignal(signal.SIGALRM)
+
+    with pytest.raises(TimeoutError), _acquire_lock(lock_path=lock_path, timeout=0.2):
+        pass
+
+    assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+    assert signal.getsignal(signal.SIGALRM) == previous_handler
+
+
+def test_acquire_lock_preserves_armed_interval_timer(held_lock):
+    """Verifies that _acquire_lock does not cancel or replace the caller's armed real-time interval timer.
+
+    Args:
+        held_lock: Fixture providing the path to a held .LOCK file and the callable that releases it.
+
+    This test ensures the FileLock fallback is used when the caller already relies on SIGALRM.
+    """
+    lock_path, _ = held_lock
+    fired = []
+    previous_handler = signal.signal(signal.SIGALRM, lambda _signal_number, _frame: fired.append(True))
+    signal.setitimer(signal.ITIMER_REAL, 0.5)
+    try:
+        with pytest.raises(TimeoutError), _acquire_lock(lock_path=lock_path, timeout=0.2):
+            pass
+
+        # The caller's timer is still armed and fires with the caller's handler.
+        assert signal.getitimer(signal.ITIMER_REAL)[0] > 0
+        time.sleep(0.5)
+        assert fired
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def test_acquire_lock_non_main_thread_timeout(held_lock):
+    """Verifies that _acquire_lock enforces the timeout when called from a non-main thread.
+
+    Args:
+        held_lock: Fixture providing the path to a held .LOCK file and the callable that releases it.
+
+    This test ensures the FileLock fallback used outside the main thread respects the lock held by other descriptors.
+    """
+    lock_path, _ = held_lock
+    errors = []
+
+    def acquire() -> None:
+        try:
+            with _acquire_lock(lock_path=lock_path, timeout=0.2):
+                pass
+        except TimeoutError as error:
+            errors.append(error)
+
+    worker = threading.Thread(target=acquire)
+    worker.start()
+    worker.join()
+    assert len(errors) == 1
+
+
 # Tests for ProcessingStatus enumeration
 
 
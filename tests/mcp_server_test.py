@@ -0,0 +1,103 @@
+"""Contains tests for the helper functions used by the MCP server to discover and load task templates."""
+
+from pathlib import Path
+
+from sl_shared_assets.interfaces.mcp_server import _load_template, _list_template_names
+
+
+def _write_template(template_path: Path, cue_length_cm: float) -> None:
+    """Writes a minimal valid task template .yaml file to the specified path.
+
+    Args:
+        template_path: The path to the task template .yaml file to write.
+        cue_length_cm: The length of the template's only cue, in centimeters.
+    """
+    template_path.write_text(
+        "cues:\n"
+        f"- name: A\n  code: 1\n  length_cm: {cue_length_cm}\n"
+        "segments:\n"
+        "- name: Segment_a\n  cue_sequence:\n  - A\n  transition_probabilities: null\n"
+        "trial_structures:\n"
+        "  trial_a:\n"
+        "    segment_name: Segment_a\n"
+        "    stimulus_trigger_zone_start_cm: 10.0\n"
+        "    stimulus_trigger_zone_end_cm: 20.0\n"
+        "    stimulus_location_cm: 15.0\n"
+        "    show_stimulus_collision_boundary: false\n"
+        "    trigger_type: lick\n"
+        "vr_environment:\n"
+        "  corridor_spacing_cm: 20.0\n"
+        "  segments_per_corridor: 3\n"
+        "  padding_prefab_name: Padding\n"
+        "  cm_per_unity_unit: 10.0\n"
+        "cue_offset_cm: 0.0\n"
+    )
+
+
+def test_list_template_names(tmp_path):
+    """Verifies that the template names are resolved from the .yaml files stored in the templates directory.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory path.
+
+    This test ensures the names are sorted, stripped of the .yaml extension, and that other files are ignored.
+    """
+    _write_template(template_path=tmp_path / "task_b.yaml", cue_length_cm=50.0)
+    _write_template(template_path=tmp_path / "task_a.yaml", cue_length_cm=50.0)
+    (tmp_path / "notes.txt").write_text("not a template")
+
+    assert _list_template_names(templates_directory=tmp_path) == ("task_a", "task_b")
+
+
+def test_list_template_names_detects_directory_changes(tmp_path):
+    """Verifies that the cached template names are refreshed when templates are added to or removed from the directory.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory path.
+
+    This test ensures the template names cache does not return stale listings.
+    """
+    _write_template(template_path=tmp_path / "task_a.yaml", cue_length_cm=50.0)
+    assert _list_template_names(templates_directory=tmp_path) == ("task_a",)
+
+    _write_template(template_path=tmp_path / "task_b.yaml", cue_length_cm=50.0)
+    assert _list_template_names(templates_directory=tmp_path) == ("task_a", "task_b")
+
+    (tmp_path / "task_a.yaml").unlink()
+    assert _list_template_names(templates_directory=tmp_path) == ("task_b",)
+
+
+def test_load_template_reuses_unchanged_template(tmp_path):
+    """Verifies that loading an unchanged template file returns the previously loaded instance.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory path.
+
+    This test ensures the template cache avoids re-parsing unchanged template files.
+    """
+    template_path = tmp_path / "task.yaml"
+    _write_template(template_path=template_path, cue_length_cm=50.0)
+
+    template = _load_template(template_path=template_path)
+
+    assert template.cues[0].length_cm == 50.0
+    assert _load_template(template_path=template_path) is template
+
+
+def test_load_template_detects_file_changes(tmp_path):
+    """Verifies that modifying a template file invalidates the cached template instance.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory path.
+
+    This test ensures the template cache does not return stale template data after the file is modified.
+    """
+    template_path = tmp_path / "task.yaml"
+    _write_template(template_path=template_path, cue_length_cm=50.0)
+    template = _load_template(template_path=template_path)
+
+    _write_template(template_path=template_path, cue_length_cm=150.0)
+    updated_template = _load_template(template_path=template_path)
+
+    assert updated_template is not template
+    assert updated_template.cues[0].length_cm == 150.0